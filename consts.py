@@ -53,6 +53,10 @@ SEASON_PASS_RIDING_CHANCE = 0.10   # Chance of a season pass holder riding on a
 MAX_TICKETS_PER_LOOP = 1000        # Maximum tickets to process per loop
 MAX_PASSES_PER_LOOP = 200          # Maximum passes to process per loop
 
+# RFID generation
+RFID_BYTES = 12                    # 96-bit RFID tags
+RFID_POOL_SIZE = 4096              # RFIDs drawn per bulk refill
+
 # Simulation speed options
 SPEED_SETTINGS = {
     "TURTLE": 120,   # 1 day = 12 minutes (120x multiplier)
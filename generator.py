@@ -183,7 +183,7 @@ class DataGenerator:
     def _process_lift_rides_for_item(self, item, world_time):
         """Process lift rides for a ticket or pass"""
         # Check if the item is riding today
-        # is_riding_today() now updates the internal _actual_days_used_list or _actual_days_skied_list
+        # is_riding_today() now updates the internal _actual_days_used or _actual_days_skied
         riding, resort = item.is_riding_today(world_time)
 
         if riding:
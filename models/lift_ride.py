@@ -5,7 +5,7 @@ import uuid
 
 import hashlib
 import random
-import json
+import orjson
 from dataclasses import dataclass
 from typing import Optional # Added for Optional type hint
 
@@ -72,7 +72,7 @@ class LiftRide:
         )
 
     def to_json(self):
-        """Convert to JSON compatible dictionary"""
+        """Serialize to UTF-8 JSON bytes"""
         data = {
             "TXID": self.txid,
             "RFID": self.rfid,
@@ -83,4 +83,4 @@ class LiftRide:
         if self.activation_day_count is not None: # Include if set
             # noinspection PyTypeChecker
             data["ACTIVATION_DAY_COUNT"] = self.activation_day_count
-        return json.dumps(data)
+        return orjson.dumps(data)
@@ -5,19 +5,20 @@ import uuid
 
 import datetime
 import hashlib
-import json
+import orjson
 import random
 from dataclasses import dataclass, field
-from typing import Optional, List
+from typing import Optional, Set
 
 from models.customer import Customer
+from models.rfid_pool import rfid_pool
 from consts import (
     TICKET_DAY_OPTIONS, TICKET_DAY_WEIGHTS, DAILY_TICKET_RIDING_CHANCE,
     RIDE_MIN_INTERVAL, RIDE_MAX_INTERVAL, REST_MIN_INTERVAL, REST_MAX_INTERVAL,
     RESORT_PROFILES
 )
 
-@dataclass
+@dataclass(slots=True)
 class ResortTicket:
     """Resort ticket with realistic properties"""
     resort: str
@@ -31,19 +32,19 @@ class ResortTicket:
 
     # Internal tracking for lift rides
     _exp: datetime.datetime = field(default_factory=datetime.datetime.now)
-    _last_ride_date_checked: Optional[datetime.datetime] = None # Tracks the last p_time this ticket's riding chance was evaluated
+    _last_ride_date_checked_ord: int = -1 # Ordinal of the last day this ticket's riding chance was evaluated
     _last_ride_date: Optional[datetime.datetime] = None # Tracks the p_time if decided to ride (for needs_ride)
     _last_lift_ridden: Optional[datetime.datetime] = None
     _rider_skill: float = 0.5  # 0-1 skill level for lift selection
 
     # Internal tracking or ticket usage
-    _actual_days_used_list: List[datetime.date] = field(default_factory=list) # Stores unique dates skied
+    _actual_days_used: Set[int] = field(default_factory=set) # Stores unique date ordinals skied
     _will_ride_decision_for_today: Optional[bool] = None # Stores the random choice for the current day
 
     @property
     def days_used_count(self) -> int:
         """Returns the number of unique days this ticket has been used."""
-        return len(self._actual_days_used_list)
+        return len(self._actual_days_used)
 
     @property
     def rider_skill(self) -> float:
@@ -57,14 +58,14 @@ class ResortTicket:
 
         # Expiration of the ticket offer/media itself (e.g., must be used by X date or within Y days of purchase)
         # For simplicity, keeping original logic: valid for roughly twice its ski_days duration from purchase.
-        # The actual ski day usage is controlled by _actual_days_used_list and self.days.
+        # The actual ski day usage is controlled by _actual_days_used and self.days.
         exp_offset_days = ticket_ski_days * 2
         exp = p_time + datetime.timedelta(days=exp_offset_days)
 
         # Generate customer info
         customer = Customer.generate(faker)
         txid = str(uuid.uuid4())
-        rfid = hex(random.getrandbits(96))
+        rfid = rfid_pool.next()
 
         # Price calculation with resort profiles
         profile = RESORT_PROFILES.get(resort, {'ticket_base_price': 100, 'weekend_multiplier': 1.5})
@@ -94,8 +95,8 @@ class ResortTicket:
         return ticket
 
     def to_json(self):
-        """Convert to JSON compatible dictionary"""
-        return json.dumps({
+        """Serialize to UTF-8 JSON bytes"""
+        return orjson.dumps({
             "TXID": self.txid,
             "RFID": self.rfid,
             "PURCHASE_TIME": self.purchase_time,
@@ -108,7 +109,7 @@ class ResortTicket:
             "EMERGENCY_CONTACT": self.customer.emergency_contact,
             "DAYS": self.days, # Number of ski days this ticket is for
             "RESORT": self.resort,
-            "DAYS_USED": len(self._actual_days_used_list) # Number of unique days skied so far
+            "DAYS_USED": len(self._actual_days_used) # Number of unique days skied so far
         })
 
     def is_expired(self, p_time: datetime.datetime) -> bool:
@@ -121,7 +122,7 @@ class ResortTicket:
         Enforces 1-day ticket usage strictly to one calendar day.
         Tracks unique days used.
         """
-        current_date = p_time.date()
+        today_ord = p_time.toordinal()
 
         # 0. Check hard expiration first
         if self.is_expired(p_time):
@@ -129,22 +130,22 @@ class ResortTicket:
 
         # 1. Enforce usage limits based on self.days (number of ski days allowed)
         # and specific 1-day ticket rule.
-        current_days_used_count = len(self._actual_days_used_list)
+        current_days_used_count = len(self._actual_days_used)
 
         if self.days == 1: # Special handling for 1-day tickets
-            if current_days_used_count > 0 and current_date not in self._actual_days_used_list:
+            if current_days_used_count > 0 and today_ord not in self._actual_days_used:
                 # It's a 1-day ticket, it has been used on a *different* day. Cannot use again.
                 return False, None
-            # If current_days_used_count is 0, or if it's >0 but current_date IS in the list, it's potentially usable.
-        elif current_days_used_count >= self.days and current_date not in self._actual_days_used_list:
+            # If current_days_used_count is 0, or if it's >0 but today IS in the set, it's potentially usable.
+        elif current_days_used_count >= self.days and today_ord not in self._actual_days_used:
             # It's a multi-day ticket, all allowed ski days have been used on *other* distinct dates.
             # Cannot use on a new distinct date.
             return False, None
 
         # 2. Determine if the holder *chooses* to ride today (random chance, decide once per day)
         # This decision is independent of the strict usage/expiration rules above.
-        if self._last_ride_date_checked is None or self._last_ride_date_checked.date() < current_date:
-            self._last_ride_date_checked = p_time
+        if self._last_ride_date_checked_ord < today_ord:
+            self._last_ride_date_checked_ord = today_ord
             self._will_ride_decision_for_today = (random.random() <= DAILY_TICKET_RIDING_CHANCE)
 
         # 3. If they choose to ride (and passed previous checks):
@@ -155,12 +156,12 @@ class ResortTicket:
             # - If multi-day ticket: either has remaining ski days, or today is one of the already used ski days.
 
             # Record this day as used if it's a new unique ski day for this ticket
-            if current_date not in self._actual_days_used_list:
+            if today_ord not in self._actual_days_used:
                 # Before adding, ensure we are not exceeding allowed days for multi-day tickets,
                 # or adding a second day for a 1-day ticket (though step 1 should catch this).
                 # This check is more of a safeguard.
-                if len(self._actual_days_used_list) < self.days:
-                    self._actual_days_used_list.append(current_date)
+                if len(self._actual_days_used) < self.days:
+                    self._actual_days_used.add(today_ord)
                 else:
                     # Should not happen if logic in step 1 is correct.
                     # Means we decided to ride, but adding this date would exceed allowed ski days.
@@ -0,0 +1,29 @@
+"""
+Pooled RFID generation for ski resort data.
+"""
+import random
+
+from consts import RFID_BYTES, RFID_POOL_SIZE
+
+
+class RFIDPool:
+    """Hands out 96-bit hex RFIDs sliced from one bulk random buffer"""
+
+    def __init__(self, pool_size=RFID_POOL_SIZE):
+        self.pool_size = pool_size
+        self._hex = ""
+        self._pos = 0
+
+    def next(self):
+        """Return the next RFID as a 0x-prefixed hex string"""
+        width = RFID_BYTES * 2
+        if self._pos + width > len(self._hex):
+            # Draw from the module RNG so seeded runs stay deterministic
+            self._hex = random.randbytes(RFID_BYTES * self.pool_size).hex()
+            self._pos = 0
+        rfid = "0x" + self._hex[self._pos:self._pos + width]
+        self._pos += width
+        return rfid
+
+
+rfid_pool = RFIDPool()
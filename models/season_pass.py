@@ -5,18 +5,19 @@ import uuid
 
 import datetime
 import hashlib
-import json
+import orjson
 import random
 from dataclasses import dataclass, field
-from typing import Optional, List
+from typing import Optional, Set
 
 from consts import (
     RESORTS, RESORT_WEIGHTS, SEASON_PASS_RIDING_CHANCE,
     RIDE_MIN_INTERVAL, RIDE_MAX_INTERVAL, REST_MIN_INTERVAL, REST_MAX_INTERVAL
 )
 from models.customer import Customer
+from models.rfid_pool import rfid_pool
 
-@dataclass
+@dataclass(slots=True)
 class SeasonPass:
     """Season pass with realistic properties"""
     txid: str = ""
@@ -28,20 +29,20 @@ class SeasonPass:
 
     # Internal tracking for lift rides
     _exp: datetime.datetime = field(default_factory=datetime.datetime.now)
-    _last_ride_date_checked: Optional[datetime.datetime] = None
+    _last_ride_date_checked_ord: int = -1 # Ordinal of the last day the riding chance was evaluated
     _last_ride_date: Optional[datetime.datetime] = None # Stores p_time if decided to ride (for needs_ride)
     _last_lift_ridden: Optional[datetime.datetime] = None
     _last_resort: Optional[str] = None
     _rider_skill: float = 0.5  # 0-1 skill level for lift selection
 
     # Internal tracking of pass usage
-    _actual_days_skied_list: List[datetime.date] = field(default_factory=list) # Stores unique dates skied
+    _actual_days_skied: Set[int] = field(default_factory=set) # Stores unique date ordinals skied
     _will_ride_decision_for_today: Optional[bool] = None # Stores the random choice for the current day
 
     @property
     def days_skied_count(self) -> int:
         """Returns the number of unique days this pass has been used."""
-        return len(self._actual_days_skied_list)
+        return len(self._actual_days_skied)
 
     @property
     def rider_skill(self) -> float:
@@ -55,7 +56,7 @@ class SeasonPass:
         # Generate customer info
         customer = Customer.generate(faker)
         txid = str(uuid.uuid4())
-        rfid = hex(random.getrandbits(96))
+        rfid = rfid_pool.next()
 
         # Season pass pricing - more realistic pricing with tiers
         price_options = [
@@ -92,8 +93,8 @@ class SeasonPass:
         return season_pass
 
     def to_json(self):
-        """Convert to JSON compatible dictionary"""
-        return json.dumps({
+        """Serialize to UTF-8 JSON bytes"""
+        return orjson.dumps({
             "TXID": self.txid,
             "RFID": self.rfid,
             "PURCHASE_TIME": self.purchase_time,
@@ -104,7 +105,7 @@ class SeasonPass:
             "PHONE": self.customer.phone,
             "EMAIL": self.customer.email,
             "EMERGENCY_CONTACT": self.customer.emergency_contact,
-            "DAYS_USED": len(self._actual_days_skied_list) # Number of unique days skied so far
+            "DAYS_USED": len(self._actual_days_skied) # Number of unique days skied so far
         })
 
     def is_expired(self, p_time: datetime.datetime) -> bool:
@@ -116,14 +117,14 @@ class SeasonPass:
         Determine if the pass holder is riding today.
         Tracks unique days skied.
         """
-        current_date = p_time.date()
+        today_ord = p_time.toordinal()
 
         if self.is_expired(p_time):
             return False, None
 
         # Determine if the holder *chooses* to ride today (random chance, decide once per day)
-        if self._last_ride_date_checked is None or self._last_ride_date_checked.date() < current_date:
-            self._last_ride_date_checked = p_time
+        if self._last_ride_date_checked_ord < today_ord:
+            self._last_ride_date_checked_ord = today_ord
             self._will_ride_decision_for_today = (random.random() <= SEASON_PASS_RIDING_CHANCE)
             if self._will_ride_decision_for_today:
                 # Choose resort for the day only if they decide to ride
@@ -132,9 +133,8 @@ class SeasonPass:
                 self._last_resort = None # Clear last resort if not riding
 
         if self._will_ride_decision_for_today:
-            # Record this day as skied if it's a new unique ski day
-            if current_date not in self._actual_days_skied_list:
-                self._actual_days_skied_list.append(current_date)
+            # Record this day as skied (the set keeps days unique)
+            self._actual_days_skied.add(today_ord)
 
             self._last_ride_date = p_time # For needs_ride logic
             return True, self._last_resort # self._last_resort was set when decision was made
@@ -1,6 +1,4 @@
 import sqlite3
-import time
-import random
 import logging
 from threading import Lock
 
@@ -10,199 +8,203 @@ from utils import configure_logging
 configure_logging()
 logger = logging.getLogger("sqlite_backend")
 
+# SQL statements are module-level constants so sqlite3's per-connection
+# statement cache is keyed by the same string on every call
+_INSERT_SEASON_PASS_SQL = "INSERT INTO SEASON_PASS (DATA) VALUES (?)"
+_INSERT_RESORT_TICKET_SQL = "INSERT INTO RESORT_TICKET (DATA) VALUES (?)"
+_INSERT_LIFT_RIDE_SQL = "INSERT INTO LIFT_RIDE (DATA) VALUES (?)"
+
+# Rows with NULL DATA are rowid placeholders (see the deletes below), never events
+_SELECT_SEASON_PASS_SQL = "SELECT ID, DATA FROM SEASON_PASS WHERE ID > ? AND DATA IS NOT NULL ORDER BY ID LIMIT ?"
+_SELECT_RESORT_TICKET_SQL = "SELECT ID, DATA FROM RESORT_TICKET WHERE ID > ? AND DATA IS NOT NULL ORDER BY ID LIMIT ?"
+_SELECT_LIFT_RIDE_SQL = "SELECT ID, DATA FROM LIFT_RIDE WHERE ID > ? AND DATA IS NOT NULL ORDER BY ID LIMIT ?"
+
+# Without AUTOINCREMENT an emptied table restarts rowids at 1, behind the
+# streamer's offset. Deletes therefore keep the highest committed row, but
+# blank its DATA so it stays only as the rowid high-water mark and is never
+# re-sent if the channel's offset is reset
+_DELETE_SEASON_PASS_SQL = "DELETE FROM SEASON_PASS WHERE ID < ?"
+_DELETE_RESORT_TICKET_SQL = "DELETE FROM RESORT_TICKET WHERE ID < ?"
+_DELETE_LIFT_RIDE_SQL = "DELETE FROM LIFT_RIDE WHERE ID < ?"
+_BLANK_SEASON_PASS_SQL = "UPDATE SEASON_PASS SET DATA = NULL WHERE ID = ?"
+_BLANK_RESORT_TICKET_SQL = "UPDATE RESORT_TICKET SET DATA = NULL WHERE ID = ?"
+_BLANK_LIFT_RIDE_SQL = "UPDATE LIFT_RIDE SET DATA = NULL WHERE ID = ?"
+
 
 class SQLiteBackend:
     """SQLite backend for persistent storage of streaming data to ensure durability"""
 
-    def __init__(self, db_path="/app/data/data.db", timeout=30.0, max_retries=5):
+    def __init__(self, db_path="/app/data/data.db", timeout=30.0):
         """Initialize the SQLite backend
 
         Args:
             db_path: Path to the SQLite database file
-            timeout: SQLite connection timeout in seconds
-            max_retries: Maximum number of retries for locked database errors
+            timeout: Seconds SQLite waits on a locked database before failing
         """
         self.db_path = db_path
         self.timeout = timeout
-        self.max_retries = max_retries
         self.lock = Lock()
 
-        # Initialize connection
-        self.con = sqlite3.connect(self.db_path, timeout=self.timeout)
+        # Initialize connection; self.lock serializes use across threads.
+        # IMMEDIATE takes the write lock when a write transaction begins, so
+        # the generator and streamer never deadlock upgrading a read lock
+        self.con = sqlite3.connect(
+            self.db_path,
+            timeout=self.timeout,
+            check_same_thread=False,
+            isolation_level="IMMEDIATE",
+        )
+
+        # Batches are read as plain (ID, DATA) tuples, never Row wrappers
+        self.con.row_factory = None
+
+        # Larger pages only take effect on a new database, before WAL is enabled
+        self.con.execute("PRAGMA page_size=8192")
 
-        # Enable WAL mode for better concurrency
+        # Enable WAL mode for better concurrency; with WAL, NORMAL sync only
+        # fsyncs at checkpoints instead of on every commit
         self.con.execute("PRAGMA journal_mode=WAL")
+        self.con.execute("PRAGMA synchronous=NORMAL")
+        self.con.execute("PRAGMA temp_store=MEMORY")
+
+        # Keep batch range scans in memory: 128 MiB page cache, 1 GiB mmap
+        self.con.execute("PRAGMA cache_size=-131072")
+        self.con.execute("PRAGMA mmap_size=1073741824")
+
+        # Let SQLite's busy handler wait out locks in C rather than retrying in Python
+        self.con.execute(f"PRAGMA busy_timeout={int(self.timeout * 1000)}")
 
         # Create tables if they don't exist
         self._initialize_tables()
 
     def _initialize_tables(self):
         """Initialize database tables"""
-        tables = [
-            "CREATE TABLE IF NOT EXISTS SEASON_PASS (ID INTEGER PRIMARY KEY AUTOINCREMENT, DATA TEXT)",
-            "CREATE TABLE IF NOT EXISTS RESORT_TICKET (ID INTEGER PRIMARY KEY AUTOINCREMENT, DATA TEXT)",
-            "CREATE TABLE IF NOT EXISTS LIFT_RIDE (ID INTEGER PRIMARY KEY AUTOINCREMENT, DATA TEXT)",
-        ]
+        tables = ["SEASON_PASS", "RESORT_TICKET", "LIFT_RIDE"]
 
         with self.lock:
-            cur = self.con.cursor()
-            for table_sql in tables:
-                cur.execute(table_sql)
+            # The streamer workers and the generator open the same database at
+            # once; one IMMEDIATE transaction takes the write lock before the
+            # schema is read, so only one process migrates or creates a table
+            # and the others see its finished schema
+            self.con.execute("BEGIN IMMEDIATE")
+            try:
+                for table in tables:
+                    self._migrate_autoincrement(table)
+                    # Plain INTEGER PRIMARY KEY aliases the rowid, skipping the
+                    # sqlite_sequence write AUTOINCREMENT does on every insert;
+                    # ID > ? batch reads seek the rowid B-tree with no extra index.
+                    # DATA holds UTF-8 JSON bytes so reads skip the text codec
+                    self.con.execute(
+                        f"CREATE TABLE IF NOT EXISTS {table} (ID INTEGER PRIMARY KEY, DATA BLOB)"
+                    )
                 self.con.commit()
+            except Exception:
+                self.con.rollback()
+                raise
 
-    def _execute_with_retry(self, operation, *args, **kwargs):
-        """Execute a database operation with retries for database locks
-
-        Args:
-            operation: Function to execute within retry logic
-            *args: Arguments to pass to the operation function
-            **kwargs: Keyword arguments to pass to the operation function
+    def _migrate_autoincrement(self, table):
+        """Rebuild a table created with AUTOINCREMENT as a plain rowid table
 
-        Returns:
-            The result of the operation function
+        Must run inside the caller's write transaction.
 
-        Raises:
-            sqlite3.OperationalError: If the database remains locked after max retries
-            Exception: Any other exceptions from the operation function
+        Args:
+            table: Name of the table to migrate
         """
-        retries = 0
-        delay = 0.1  # Initial delay in seconds
-
-        while True:
-            try:
-                return operation(*args, **kwargs)
-            except sqlite3.OperationalError as e:
-                if "database is locked" in str(e) and retries < self.max_retries:
-                    retries += 1
-                    # Log retry attempt
-                    logger.warning(
-                        f"Database locked, retrying ({retries}/{self.max_retries})..."
-                    )
-
-                    # Sleep with exponential backoff and some randomness
-                    time.sleep(delay * (0.8 + 0.4 * random.random()))
-                    delay = min(delay * 2, 5.0)  # Cap at 5 seconds
-                else:
-                    # We've exhausted retries or it's a different error
-                    if "database is locked" in str(e):
-                        logger.error(
-                            f"Database still locked after {self.max_retries} retries"
-                        )
-                    raise
-
-    # Store operations with retry logic
+        row = self.con.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?",
+            (table,),
+        ).fetchone()
+        if row is None or "AUTOINCREMENT" not in row[0].upper():
+            return
+
+        logger.info(f"Migrating {table} to INTEGER PRIMARY KEY without AUTOINCREMENT")
+        self.con.execute(f"ALTER TABLE {table} RENAME TO {table}_OLD")
+        self.con.execute(f"CREATE TABLE {table} (ID INTEGER PRIMARY KEY, DATA BLOB)")
+        self.con.execute(
+            f"INSERT INTO {table} (ID, DATA) SELECT ID, DATA FROM {table}_OLD"
+        )
+
+        # An emptied table would restart IDs at 1, behind the streamer's
+        # offset; keep a placeholder row at the old sequence value instead.
+        # Its DATA is NULL, which batch reads skip
+        seq = self.con.execute(
+            "SELECT seq FROM sqlite_sequence WHERE name = ?", (f"{table}_OLD",)
+        ).fetchone()
+        if seq is not None:
+            self.con.execute(
+                f"INSERT OR IGNORE INTO {table} (ID, DATA) VALUES (?, NULL)", (seq[0],)
+            )
+
+        self.con.execute(f"DROP TABLE {table}_OLD")
+
+    # Store operations
 
     def StoreSeasonPass(self, season_pass):
-        """Store a season pass with retry logic"""
+        """Store a season pass"""
         data = season_pass.to_json()
 
-        def _insert():
-            with self.lock:
-                cur = self.con.cursor()
-                cur.execute("INSERT INTO SEASON_PASS (DATA) VALUES (?)", (data,))
-                self.con.commit()
-
-        self._execute_with_retry(_insert)
+        with self.lock:
+            self.con.execute(_INSERT_SEASON_PASS_SQL, (data,))
+            self.con.commit()
 
     def StoreResortTicket(self, resort_ticket):
-        """Store a resort ticket with retry logic"""
+        """Store a resort ticket"""
         data = resort_ticket.to_json()
 
-        def _insert():
-            with self.lock:
-                cur = self.con.cursor()
-                cur.execute("INSERT INTO RESORT_TICKET (DATA) VALUES (?)", (data,))
-                self.con.commit()
-
-        self._execute_with_retry(_insert)
+        with self.lock:
+            self.con.execute(_INSERT_RESORT_TICKET_SQL, (data,))
+            self.con.commit()
 
     def StoreLiftRide(self, lift_ride):
-        """Store a lift ride with retry logic"""
+        """Store a lift ride"""
         data = lift_ride.to_json()
 
-        def _insert():
-            with self.lock:
-                cur = self.con.cursor()
-                cur.execute("INSERT INTO LIFT_RIDE (DATA) VALUES (?)", (data,))
-                self.con.commit()
-
-        self._execute_with_retry(_insert)
+        with self.lock:
+            self.con.execute(_INSERT_LIFT_RIDE_SQL, (data,))
+            self.con.commit()
 
-    # Batch retrieve operations with retry logic
+    # Batch retrieve operations
 
     def GetSeasonPassBatch(self, after_id, batch_size):
-        """Get a batch of season passes with retry logic"""
-
-        def _select():
-            with self.lock:
-                cur = self.con.cursor()
-                cur.execute(
-                    "SELECT ID, DATA FROM SEASON_PASS WHERE ID > ? LIMIT ?",
-                    (after_id, batch_size),
-                )
-                return cur.fetchall()
-
-        return self._execute_with_retry(_select)
+        """Get a batch of season passes"""
+        with self.lock:
+            return self.con.execute(
+                _SELECT_SEASON_PASS_SQL, (after_id, batch_size)
+            ).fetchall()
 
     def GetResortTicketBatch(self, after_id, batch_size):
-        """Get a batch of resort tickets with retry logic"""
-
-        def _select():
-            with self.lock:
-                cur = self.con.cursor()
-                cur.execute(
-                    "SELECT ID, DATA FROM RESORT_TICKET WHERE ID > ? LIMIT ?",
-                    (after_id, batch_size),
-                )
-                return cur.fetchall()
-
-        return self._execute_with_retry(_select)
+        """Get a batch of resort tickets"""
+        with self.lock:
+            return self.con.execute(
+                _SELECT_RESORT_TICKET_SQL, (after_id, batch_size)
+            ).fetchall()
 
     def GetLiftRideBatch(self, after_id, batch_size):
-        """Get a batch of lift rides with retry logic"""
-
-        def _select():
-            with self.lock:
-                cur = self.con.cursor()
-                cur.execute(
-                    "SELECT ID, DATA FROM LIFT_RIDE WHERE ID > ? LIMIT ?",
-                    (after_id, batch_size),
-                )
-                return cur.fetchall()
-
-        return self._execute_with_retry(_select)
+        """Get a batch of lift rides"""
+        with self.lock:
+            return self.con.execute(
+                _SELECT_LIFT_RIDE_SQL, (after_id, batch_size)
+            ).fetchall()
 
-    # Delete operations with retry logic
+    # Delete operations
 
     def DeleteSeasonPasses(self, before_id):
-        """Delete season passes with retry logic"""
-
-        def _delete():
-            with self.lock:
-                cur = self.con.cursor()
-                cur.execute("DELETE FROM SEASON_PASS WHERE ID <= ?", (before_id,))
-                self.con.commit()
-
-        self._execute_with_retry(_delete)
+        """Delete season passes"""
+        with self.lock:
+            self.con.execute(_DELETE_SEASON_PASS_SQL, (before_id,))
+            self.con.execute(_BLANK_SEASON_PASS_SQL, (before_id,))
+            self.con.commit()
 
     def DeleteResortTickets(self, before_id):
-        """Delete resort tickets with retry logic"""
-
-        def _delete():
-            with self.lock:
-                cur = self.con.cursor()
-                cur.execute("DELETE FROM RESORT_TICKET WHERE ID <= ?", (before_id,))
-                self.con.commit()
-
-        self._execute_with_retry(_delete)
+        """Delete resort tickets"""
+        with self.lock:
+            self.con.execute(_DELETE_RESORT_TICKET_SQL, (before_id,))
+            self.con.execute(_BLANK_RESORT_TICKET_SQL, (before_id,))
+            self.con.commit()
 
     def DeleteLiftRides(self, before_id):
-        """Delete lift rides with retry logic"""
-
-        def _delete():
-            with self.lock:
-                cur = self.con.cursor()
-                cur.execute("DELETE FROM LIFT_RIDE WHERE ID <= ?", (before_id,))
-                self.con.commit()
-
-        self._execute_with_retry(_delete)
+        """Delete lift rides"""
+        with self.lock:
+            self.con.execute(_DELETE_LIFT_RIDE_SQL, (before_id,))
+            self.con.execute(_BLANK_LIFT_RIDE_SQL, (before_id,))
+            self.con.commit()
@@ -1,38 +1,64 @@
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import closing
+import functools
 import logging
+import multiprocessing
 import os
+import queue
 import threading
 import time
-import json
+from types import SimpleNamespace
 
+import msgspec
 from dotenv import load_dotenv
 
-from snowflake.ingest.streaming import StreamingIngestClient
+from snowflake.ingest.streaming import StreamingIngestClient, StreamingIngestError
 
 from storage.sqlite_backend import SQLiteBackend
 from utils import configure_logging
 
-configure_logging(logging.DEBUG)
 logger = logging.getLogger("ski_data_streamer")
 
-load_dotenv()
-
 # parameters
 channel_name = "DE214-CODESPACE"
-database_name = os.getenv("DATABASE_NAME")
-schema_name = os.getenv("SCHEMA_NAME")
-client_name = os.getenv("CLIENT_NAME")
-account_name = os.getenv("SNOWFLAKE_ACCOUNT")
-host_name = os.getenv(
-    "SNOWFLAKE_HOST", f"{account_name}.snowflakecomputing.com"
-).replace("_", "-")
-user_name = os.getenv("SNOWFLAKE_USER")
-private_key = os.getenv("PRIVATE_KEY")
-BATCH_SIZE = 10000
+INITIAL_BATCH_SIZE = 2000  # Rows per append before adapting
+MIN_BATCH_SIZE = 500
+MAX_BATCH_SIZE = 50000
+BATCH_TARGET_SECONDS = 0.2  # Grow batches while appends finish faster than this
+COMMIT_POLL_MIN_INTERVAL_SECONDS = 0.05  # First committed offset check after a batch
+COMMIT_POLL_MAX_INTERVAL_SECONDS = 1  # Backoff cap while the commit has not advanced
+MAX_IN_FLIGHT_BATCHES = 4  # Appended batches allowed to await commit
+IDLE_MIN_SLEEP_SECONDS = 0.01  # First sleep once SQLite has no new rows
+IDLE_MAX_SLEEP_SECONDS = 0.5  # Cap for the doubling idle sleep
 
 LOOP_LOG_INTERVAL_SECONDS = 10  # Log every N seconds
 
 
+@functools.lru_cache(maxsize=1)
+def _config():
+    """Read connection settings from .env and the environment once per process"""
+    load_dotenv()
+    account_name = os.getenv("SNOWFLAKE_ACCOUNT")
+    host_name = os.getenv(
+        "SNOWFLAKE_HOST", f"{account_name}.snowflakecomputing.com"
+    ).replace("_", "-")
+    return SimpleNamespace(
+        database_name=os.getenv("DATABASE_NAME"),
+        schema_name=os.getenv("SCHEMA_NAME"),
+        client_name=os.getenv("CLIENT_NAME"),
+        # Shared by every pipe's client; each client is bound to a single pipe
+        client_properties={
+            "user": os.getenv("SNOWFLAKE_USER"),
+            "account": account_name,
+            "private_key": os.getenv("PRIVATE_KEY"),
+            "host": host_name,
+        },
+        resort_ticket_pipe_name=os.getenv("RESORT_TICKET_PIPE_NAME"),
+        season_pass_pipe_name=os.getenv("SEASON_PASS_PIPE_NAME"),
+        lift_ride_pipe_name=os.getenv("LIFT_RIDE_PIPE_NAME"),
+    )
+
+
 def stream_data(pipe_name, fn_get_data, fn_delete_data):
     # Write this function to stream data to Snowflake
     # Answer key in .soln.txt
@@ -41,39 +67,55 @@ def stream_data(pipe_name, fn_get_data, fn_delete_data):
 
 
 def stream_resort_tickets():
-    pipe_name = os.getenv("RESORT_TICKET_PIPE_NAME")
+    pipe_name = _config().resort_ticket_pipe_name
     backend = SQLiteBackend()
     stream_data(pipe_name, backend.GetResortTicketBatch, backend.DeleteResortTickets)
 
 
 def stream_season_passes():
-    pipe_name = os.getenv("SEASON_PASS_PIPE_NAME")
+    pipe_name = _config().season_pass_pipe_name
     backend = SQLiteBackend()
     stream_data(pipe_name, backend.GetSeasonPassBatch, backend.DeleteSeasonPasses)
 
 
 def stream_lift_rides():
-    pipe_name = os.getenv("LIFT_RIDE_PIPE_NAME")
+    pipe_name = _config().lift_ride_pipe_name
     backend = SQLiteBackend()
     stream_data(pipe_name, backend.GetLiftRideBatch, backend.DeleteLiftRides)
 
 
+def _run_worker(stream_fn):
+    """Process entry point: configure logging in the child, then stream"""
+    configure_logging(logging.DEBUG)
+    stream_fn()
+
+
 def main():
-    logger.info("Starting ski data streamer with 3 threads")
+    configure_logging(logging.DEBUG)
+    logger.info("Starting ski data streamer with 3 processes")
+    # Load settings up front so forked workers inherit the cached config
+    _config()
 
+    # Separate processes keep each pipe's JSON and SQLite work off a shared GIL
     fns = [
-        threading.Thread(target=stream_resort_tickets, name="ResortTickets"),
-        threading.Thread(target=stream_season_passes, name="SeasonPasses"),
-        threading.Thread(target=stream_lift_rides, name="LiftRides"),
+        multiprocessing.Process(
+            target=_run_worker, args=(stream_resort_tickets,), name="ResortTickets"
+        ),
+        multiprocessing.Process(
+            target=_run_worker, args=(stream_season_passes,), name="SeasonPasses"
+        ),
+        multiprocessing.Process(
+            target=_run_worker, args=(stream_lift_rides,), name="LiftRides"
+        ),
     ]
 
-    logger.info(f"Created {len(fns)} threads")
+    logger.info(f"Created {len(fns)} processes")
 
     for fn in fns:
         fn.start()
-        logger.info(f"Started thread: {fn.name}")
+        logger.info(f"Started process: {fn.name}")
 
-    logger.info("All threads started, waiting for completion...")
+    logger.info("All processes started, waiting for completion...")
 
     for fn in fns:
         fn.join()
@@ -1,19 +1,54 @@
+import functools
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 import pytz
 import streamlit as st
+import threading
+import time
 from datetime import datetime
 from datetime import timedelta
+from dateutil.relativedelta import relativedelta
+from snowflake.snowpark import DataFrame
 from snowflake.snowpark.context import get_active_session
-from snowflake.snowpark.functions import col, sum, avg, max, when, desc, lit, convert_timezone, hour
-from typing import Optional
+from snowflake.snowpark.functions import col, max, desc, lit, div0, row_number
+from snowflake.snowpark.types import (BooleanType, ByteType, DataType, DecimalType, DoubleType, FloatType,
+                                      IntegerType, LongType, ShortType, TimestampType)
+from snowflake.snowpark.window import Window
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+# Plotly is slow to import, so it is loaded where charts are built and the page header paints first
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
 
 # Global configuration
 DEFAULT_CACHE_TTL = 60  # seconds
+REFERENCE_CACHE_TTL = 24 * 60 * 60  # seconds; RESORT_CAPACITY only changes when resorts are added
+WEEKLY_CACHE_TTL = 5 * 60  # seconds; weekly rollups move slowly compared to hourly data
+CACHE_MAX_ENTRIES = 32  # per cached page loader or chart; covers every period/metric and resort selection
+QUERY_TAG_PREFIX = "ski_resort_dashboard"  # identifies this app's queries in Query History
 NETWORK_PAGE_NAME = "Network Overview"
+NETWORK_VIEWS = ("kpis", "status", "comparison", "time_series")  # sections fed by the network page query
 RESORT_PAGE_NAME = "Mountain Operations Center"
 
+# Display lookups shared by every rerun
+RANK_EMOJI = {1: "🥇", 2: "🥈", 3: "🥉"}
+CAPACITY_STATUS_ICONS = {"HIGH": "🔴", "MODERATE": "🟡", "NORMAL": "🟢"}
+REVENUE_STATUS_ICONS = {'ABOVE_TARGET': '🟢', 'NEAR_TARGET': '🟡', 'BELOW_TARGET': '🔴'}
+# Lift activity buckets by rides per hour: bin edges, labels and icons
+ACTIVITY_BINS = [float("-inf"), 100, 200, float("inf")]
+ACTIVITY_LABELS = ["Normal", "Active", "Hot"]
+ACTIVITY_ICONS = {"Hot": "🔥", "Active": "⚡", "Normal": "🟢"}
+# Weekly performance columns shown on the resort page and their headers
+WEEKLY_COLUMN_MAP = {
+    'WEEK_START_DATE': 'Week Starting',
+    'MAX_DAILY_UNIQUE_VISITORS': 'Max Daily Visitors',
+    'AVG_DAILY_UNIQUE_VISITORS': 'Avg Daily Visitors',
+    'WEEK_TOTAL_REVENUE': 'Total Revenue',
+    'AVG_DAILY_REVENUE': 'Avg Daily Revenue',
+    'WEEK_PEAK_CAPACITY_PCT': 'Peak Capacity'
+}
+# Shared styling merged into each network chart's layout at construction
+CHART_LAYOUT = dict(font_family="Arial", title_font_size=16, plot_bgcolor="white", paper_bgcolor="white")
+
 # High-level page configuration
 # This must be the first Streamlit command
 st.set_page_config(
@@ -42,9 +77,41 @@ def init_session():
 session = init_session()
 
 
+class SharedCache:
+    """
+    Process-wide TTL cache for small lookups that every page render needs.
+    Only one caller refreshes an expired value; concurrent viewers wait and reuse its result.
+    Cached values are shared across sessions and must be treated as read-only.
+    """
+
+    def __init__(self, fetch: Callable[[], Any], ttl: float = DEFAULT_CACHE_TTL):
+        self.fetch = fetch
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.entry = None  # (fetched_at, data), swapped as one reference
+
+    def _fresh_entry(self):
+        entry = self.entry
+        if entry is not None and time.monotonic() - entry[0] < self.ttl:
+            return entry
+        return None
+
+    def get(self) -> Any:
+        entry = self._fresh_entry()
+        if entry is None:
+            with self.lock:
+                entry = self._fresh_entry()
+                if entry is None:
+                    entry = (time.monotonic(), self.fetch())
+                    self.entry = entry
+        return entry[1]
+
+    def clear(self):
+        self.entry = None
+
+
 # Helper function to get date values
-@st.cache_data(ttl=DEFAULT_CACHE_TTL)
-def get_network_reporting_time_data():
+def fetch_network_reporting_time_data():
     """
     Get various date values for the current simulation state.
     In a normal application, you could just use current time from the app or database.
@@ -60,8 +127,13 @@ def get_network_reporting_time_data():
                    (SELECT MAX(RIDE_HOUR_TIMESTAMP) FROM HOURLY_RESORT_SUMMARY) as latest_reporting_timestamp; \
             """
 
-    result = session.sql(query).collect()[0]
+    result = session.sql(query).collect(statement_params=query_tag("sim_clock"))[0]
     latest_world_time = result[0]
+    if result[1] is None:
+        # No events yet: every date is unknown, so period filters match nothing and the banner shows "--"
+        return {'latest_world_time': latest_world_time, 'latest_reporting_time': None, 'current_date': None,
+                'current_hour': None, 'yesterday': None, 'week_ago': None, 'two_weeks_ago': None,
+                'month_start': None, 'prev_month_start': None}
     latest_reporting_time = result[1]
 
     # Calculate all date values in Python
@@ -73,10 +145,7 @@ def get_network_reporting_time_data():
 
     # Month start calculations
     month_start = latest_reporting_date.replace(day=1)
-    if month_start.month == 1:
-        prev_month_start = month_start.replace(year=month_start.year - 1, month=12)
-    else:
-        prev_month_start = month_start.replace(month=month_start.month - 1)
+    prev_month_start = month_start - relativedelta(months=1)
 
     time_data = {
         'latest_world_time': latest_world_time,
@@ -91,25 +160,38 @@ def get_network_reporting_time_data():
     }
     return time_data
 
+
+@st.cache_resource
+def network_reporting_time_cache() -> SharedCache:
+    return SharedCache(fetch_network_reporting_time_data)
+
+
+def get_network_reporting_time_data():
+    return network_reporting_time_cache().get()
+
 def get_world_clock_time():
     return get_network_reporting_time_data()["latest_world_time"]
 
-def get_network_reporting_time() -> datetime:
+def get_network_reporting_time() -> Optional[datetime]:
     return get_network_reporting_time_data()["latest_reporting_time"]
 
-@st.cache_data(ttl=DEFAULT_CACHE_TTL)
-def get_resort_reporting_time(selected_resort: str) -> datetime:
+def fetch_resort_reporting_time(selected_resort: str) -> Optional[datetime]:
     last_activity_time = session.table("HOURLY_RESORT_SUMMARY").filter(col("RESORT") == selected_resort).agg(
-        max(col("RIDE_HOUR_TIMESTAMP")).alias("last_activity_time")).collect()[0][0]
+        max(col("RIDE_HOUR_TIMESTAMP")).alias("last_activity_time")).collect(
+        statement_params=query_tag("resort_reporting_time"))[0][0]
+    # None when the resort has no activity yet
     return last_activity_time
 
-def get_resort_reporting_date(selected_resort: str) -> datetime.date:
-    ts = get_resort_reporting_time(selected_resort)
-    return ts.date()
 
-def get_resort_reporting_hour(selected_resort: str) -> int:
-    ts = get_resort_reporting_time(selected_resort)
-    return ts.hour
+# One shared clock per resort: the status banner and the resort page loader read the same
+# timestamp without re-running the query or unpickling a cache_data entry
+@st.cache_resource
+def resort_reporting_time_cache(selected_resort: str) -> SharedCache:
+    return SharedCache(functools.partial(fetch_resort_reporting_time, selected_resort))
+
+
+def get_resort_reporting_time(selected_resort: str) -> datetime:
+    return resort_reporting_time_cache(selected_resort).get()
 
 # Helper function to display simulation status
 def display_simulation_status(resort=None):
@@ -159,110 +241,225 @@ def display_simulation_status(resort=None):
         st.error(f"Error fetching simulation status: {str(e)}")
 
 
-# Data fetching functions using Snowpark
-@st.cache_data(ttl=DEFAULT_CACHE_TTL)
-def get_network_kpis(time_period: str) -> tuple[pd.DataFrame, pd.DataFrame]:
-    """Fetch network-wide KPIs for current and previous periods."""
-    time_data = get_network_reporting_time_data()
+def query_tag(name: str) -> dict[str, str]:
+    """Statement parameters tagging a query with the dashboard data it loads."""
+    return {"QUERY_TAG": f"{QUERY_TAG_PREFIX}:{name}"}
 
-    # Define date filters
-    if time_period == "Today":
-        current_filter = col("RIDE_DATE") == time_data['current_date']
-        previous_filter = col("RIDE_DATE") == time_data['yesterday']
-    elif time_period == "Last 7 Days":
-        current_filter = col("RIDE_DATE") >= time_data['week_ago']
-        previous_filter = (col("RIDE_DATE") >= time_data['two_weeks_ago']) & (col("RIDE_DATE") < time_data['week_ago'])
-    else:  # Month to Date
-        current_filter = col("RIDE_DATE") >= time_data['month_start']
-        previous_filter = (col("RIDE_DATE") >= time_data['prev_month_start']) & (col("RIDE_DATE") < time_data['month_start'])
-
-    # Current period metrics
-    current_metrics_df = session.table("V_DAILY_NETWORK_METRICS").filter(current_filter).agg(
-        sum(col("TOTAL_NETWORK_VISITORS")).alias("total_visitors"),
-        sum(col("TOTAL_NETWORK_REVENUE")).alias("total_revenue"),
-        avg(col("AVG_NETWORK_CAPACITY_PCT")).alias("avg_capacity"),
-        sum(col("TOTAL_NETWORK_RIDES")).alias("total_rides")
-    )
-    # Previous period metrics
-    previous_metrics_df = session.table("V_DAILY_NETWORK_METRICS").filter(previous_filter).agg(
-        sum(col("TOTAL_NETWORK_VISITORS")).alias("prev_visitors"),
-        sum(col("TOTAL_NETWORK_REVENUE")).alias("prev_revenue"),
-        sum(col("TOTAL_NETWORK_RIDES")).alias("prev_rides")
-    )
 
-    return current_metrics_df.to_pandas(), previous_metrics_df.to_pandas()
+# Run independent queries concurrently
+def collect_async(queries: dict[str, Callable[[], DataFrame]]) -> dict[str, Any]:
+    """
+    Build and submit named Snowpark queries without blocking, then wait for all of them.
+    Wall time is that of the slowest query instead of the sum of all queries.
+    Each query is tagged with its name. A query that fails to build, run or load is stored as None with its
+    error under page_data["errors"], so only the section showing it reports the failure.
+    """
+    page_data = {"errors": {}}
+    jobs = {}
+    for name, build_query in queries.items():
+        try:
+            query = build_query()
+            jobs[name] = (query, query.to_pandas(block=False, statement_params=query_tag(name)))
+        except Exception as e:
+            page_data[name] = None
+            page_data["errors"][name] = str(e)
+    for name, (query, job) in jobs.items():
+        load_step(page_data, name, functools.partial(collect_batches, query, job))
+    return page_data
 
 
-@st.cache_data(ttl=DEFAULT_CACHE_TTL)
-def get_network_resort_comparison(time_period: str) -> pd.DataFrame:
-    """Fetch resort comparison data for the specified period."""
-    time_data = get_network_reporting_time_data()
-    if time_period == "Today":
-        date_filter = col("RIDE_DATE") == time_data['current_date']
-    elif time_period == "Last 7 Days":
-        date_filter = col("RIDE_DATE") >= time_data['week_ago']
-    else:  # Month to Date
-        date_filter = col("RIDE_DATE") >= time_data['month_start']
-    results_df = (session.table("DAILY_RESORT_SUMMARY")
-                  .filter(date_filter)
-                  .group_by("RESORT")
-                  .agg(
-        sum(col("TOTAL_VISITORS")).alias("TOTAL_VISITORS"),
-        sum(col("TOTAL_REVENUE")).alias("TOTAL_REVENUE"),
-        avg(col("AVG_CAPACITY_PCT")).alias("AVG_CAPACITY"),
-        sum(col("TOTAL_RIDES")).alias("TOTAL_RIDES")
-    ).order_by("RESORT"))
-    return results_df.to_pandas()
-
-
-@st.cache_data(ttl=DEFAULT_CACHE_TTL)
-def get_network_time_series_data(time_period: str) -> pd.DataFrame:
-    """Fetch time series data for trends analysis."""
-    time_data = get_network_reporting_time_data()
-    if time_period == "Today":
-        date_filter = col("RIDE_DATE") == time_data['current_date']
-    elif time_period == "Last 7 Days":
-        date_filter = col("RIDE_DATE") >= time_data['week_ago']
-    else:  # Month to Date
-        date_filter = col("RIDE_DATE") >= time_data['month_start']
-    results_df = (session.table("DAILY_RESORT_SUMMARY")
-                  .filter(date_filter)
-                  .select("RIDE_DATE", "RESORT",
-                          col("TOTAL_VISITORS").alias("VISITORS"),
-                          col("TOTAL_REVENUE").alias("REVENUE"),
-                          col("AVG_CAPACITY_PCT").alias("CAPACITY_PCT"))
-                  .order_by("RIDE_DATE", "RESORT"))
-    return results_df.to_pandas()
+def load_step(page_data: dict[str, Any], name: str, step: Callable[[], Any]) -> None:
+    """Store one section's data under name, or record its error so the rest of the page still renders."""
+    try:
+        page_data[name] = step()
+    except Exception as e:
+        page_data[name] = None
+        page_data["errors"][name] = str(e)
+
+
+class PageDataError(Exception):
+    """
+    Carries a page's partial data out of its cached loader when any section failed.
+    st.cache_data never caches a raised exception, so a transient failure is retried on the next run.
+    """
+
+    def __init__(self, page_data: dict[str, Any]):
+        super().__init__(page_data["errors"])
+        self.page_data = page_data
+
+
+def raise_if_failed(page_data: dict[str, Any]) -> dict[str, Any]:
+    """Return page_data, or raise PageDataError with it when any section recorded an error."""
+    if page_data["errors"]:
+        raise PageDataError(page_data)
+    return page_data
+
+
+def page_section(page_data: dict[str, Any], name: str) -> Any:
+    """Return one section's data, raising the error its load hit so that section's handler reports it."""
+    error = page_data["errors"].get(name)
+    if error is not None:
+        raise RuntimeError(error)
+    return page_data[name]
+
+
+def collect_batches(query: DataFrame, job) -> pd.DataFrame:
+    """
+    Read a query result as pandas batches as they arrive and stitch them together.
+    This avoids holding the full Arrow result and its pandas copy at the same time on larger periods.
+    """
+    batches = list(job.result("pandas_batches"))
+    if not batches:
+        # Typed like a non-empty result, so numeric summaries work on it instead of failing on object columns
+        return pd.DataFrame({name: pd.Series(dtype=pandas_dtype(field.datatype))
+                             for name, field in zip(query.columns, query.schema.fields)})
+    if len(batches) == 1:
+        return downcast_integers(batches[0])
+    return downcast_integers(pd.concat(batches, ignore_index=True))
+
+
+def pandas_dtype(datatype: DataType) -> str:
+    """pandas dtype that Snowpark gives a column of this Snowflake type."""
+    if isinstance(datatype, (LongType, IntegerType, ShortType, ByteType)) or (
+            isinstance(datatype, DecimalType) and datatype.scale == 0):
+        return "int64"
+    if isinstance(datatype, (DecimalType, DoubleType, FloatType)):
+        return "float64"
+    if isinstance(datatype, BooleanType):
+        return "bool"
+    if isinstance(datatype, TimestampType):
+        return "datetime64[ns]"
+    return "object"
+
+
+def downcast_integers(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Store integer columns in the narrowest dtype that holds their values, shrinking what st.cache_data pickles.
+    Float columns are left alone: revenue totals need float64 precision.
+    """
+    for column in df.select_dtypes("integer").columns:
+        df[column] = pd.to_numeric(df[column], downcast="integer")
+    return df
 
 
-@st.cache_data(ttl=DEFAULT_CACHE_TTL)
-def get_network_status_by_resort(time_period: str) -> pd.DataFrame:
-    """Fetch current status for all resorts."""
+# Query builders using Snowpark
+def query_network_daily_resort_data(time_period: str) -> DataFrame:
+    """Build per-resort, per-day summary query for the current and previous periods in a single scan."""
     time_data = get_network_reporting_time_data()
+    return network_daily_resort_plan(time_period, time_data['current_date'], time_data['yesterday'],
+                                     time_data['week_ago'], time_data['two_weeks_ago'],
+                                     time_data['month_start'], time_data['prev_month_start'])
+
+
+def network_daily_resort_plan(time_period: str, current_date, yesterday, week_ago, two_weeks_ago,
+                              month_start, prev_month_start) -> DataFrame:
+    """Build the current and previous period query; only runs on a fetch_network_page_data cache miss."""
+    # Define date filters
     if time_period == "Today":
-        date_filter = col("RIDE_DATE") == time_data['current_date']
+        current_filter = col("RIDE_DATE") == current_date
+        previous_filter = col("RIDE_DATE") == yesterday
     elif time_period == "Last 7 Days":
-        date_filter = col("RIDE_DATE") >= time_data['week_ago']
+        current_filter = col("RIDE_DATE") >= week_ago
+        previous_filter = (col("RIDE_DATE") >= two_weeks_ago) & (col("RIDE_DATE") < week_ago)
     else:  # Month to Date
-        date_filter = col("RIDE_DATE") >= time_data['month_start']
+        current_filter = col("RIDE_DATE") >= month_start
+        previous_filter = (col("RIDE_DATE") >= prev_month_start) & (col("RIDE_DATE") < month_start)
+
+    # Scan both periods once; IS_CURRENT splits current rows from the previous period's rows
     results_df = (session.table("DAILY_RESORT_SUMMARY")
-                  .filter(date_filter)
-                  .group_by("RESORT")
-                  .agg(
-        sum(col("TOTAL_VISITORS")).alias("CURRENT_VISITORS"),
-        avg(col("AVG_CAPACITY_PCT")).alias("CAPACITY_PCT"),
-        sum(col("TOTAL_REVENUE")).alias("REVENUE")
-    )
-                  .with_column("STATUS",
-                               when(col("CAPACITY_PCT") < 70, lit("🟢 Normal"))
-                               .when(col("CAPACITY_PCT") < 90, lit("🟡 Busy"))
-                               .otherwise(lit("🔴 At Capacity")))
-                  .order_by(desc("CAPACITY_PCT")))
-    return results_df.to_pandas()
+                  .filter(current_filter | previous_filter)
+                  .select("RIDE_DATE", "RESORT", "TOTAL_VISITORS", "TOTAL_REVENUE",
+                          "AVG_CAPACITY_PCT", "TOTAL_RIDES", current_filter.alias("IS_CURRENT"))
+                  .order_by("RIDE_DATE", "RESORT"))
+    return results_df
+
+
+def summarize_network_kpis(current_df: pd.DataFrame, previous_df: pd.DataFrame) -> pd.DataFrame:
+    """Aggregate network-wide KPIs for the current period, with previous period totals for comparison."""
+    if current_df.empty:
+        # No rows for the period: an empty result lets the page show its "no data" message
+        return pd.DataFrame(columns=["TOTAL_VISITORS", "TOTAL_REVENUE", "AVG_CAPACITY", "TOTAL_RIDES",
+                                     "PREV_VISITORS", "PREV_REVENUE", "PREV_RIDES"])
+    # Mirrors V_DAILY_NETWORK_METRICS: daily network capacity is the mean across resorts rounded to one
+    # decimal. pandas rounds halves to even where Snowflake's ROUND rounds them away from zero, so a day
+    # can differ by 0.1
+    daily_capacity = current_df.groupby("RIDE_DATE")["AVG_CAPACITY_PCT"].mean().round(1)
+    return pd.DataFrame([{
+        "TOTAL_VISITORS": current_df["TOTAL_VISITORS"].sum(min_count=1),
+        "TOTAL_REVENUE": current_df["TOTAL_REVENUE"].sum(min_count=1),
+        "AVG_CAPACITY": daily_capacity.mean(),
+        "TOTAL_RIDES": current_df["TOTAL_RIDES"].sum(min_count=1),
+        "PREV_VISITORS": previous_df["TOTAL_VISITORS"].sum(min_count=1),
+        "PREV_REVENUE": previous_df["TOTAL_REVENUE"].sum(min_count=1),
+        "PREV_RIDES": previous_df["TOTAL_RIDES"].sum(min_count=1),
+    }])
+
+
+def summarize_network_resort_comparison(daily_df: pd.DataFrame) -> pd.DataFrame:
+    """Aggregate daily resort rows into period totals per resort."""
+    return (daily_df.groupby("RESORT", as_index=False)
+            .agg(TOTAL_VISITORS=("TOTAL_VISITORS", "sum"),
+                 TOTAL_REVENUE=("TOTAL_REVENUE", "sum"),
+                 AVG_CAPACITY=("AVG_CAPACITY_PCT", "mean"),
+                 TOTAL_RIDES=("TOTAL_RIDES", "sum"))
+            .sort_values("RESORT", ignore_index=True))
+
+
+def summarize_network_status_by_resort(comparison_df: pd.DataFrame) -> pd.DataFrame:
+    """Derive current status for all resorts from the period totals."""
+    status_df = comparison_df.rename(columns={"TOTAL_VISITORS": "CURRENT_VISITORS",
+                                              "AVG_CAPACITY": "CAPACITY_PCT",
+                                              "TOTAL_REVENUE": "REVENUE"})
+    status_df["STATUS"] = (pd.cut(status_df["CAPACITY_PCT"], [float("-inf"), 70, 90, float("inf")],
+                                  right=False, labels=["🟢 Normal", "🟡 Busy", "🔴 At Capacity"])
+                           .astype(object)
+                           .fillna("🔴 At Capacity"))
+    return status_df[["RESORT", "CURRENT_VISITORS", "CAPACITY_PCT", "REVENUE", "STATUS"]].sort_values(
+        "CAPACITY_PCT", ascending=False, ignore_index=True)
+
+
+def summarize_network_time_series_data(daily_df: pd.DataFrame) -> pd.DataFrame:
+    """Project daily resort rows into the trends analysis series."""
+    return daily_df[["RIDE_DATE", "RESORT", "TOTAL_VISITORS", "TOTAL_REVENUE", "AVG_CAPACITY_PCT"]].rename(
+        columns={"TOTAL_VISITORS": "VISITORS", "TOTAL_REVENUE": "REVENUE", "AVG_CAPACITY_PCT": "CAPACITY_PCT"})
+
+
+@st.cache_data(ttl=DEFAULT_CACHE_TTL, max_entries=CACHE_MAX_ENTRIES)
+def fetch_network_page_data(time_period: str, data_version: Optional[datetime]) -> dict[str, Any]:
+    """
+    Fetch all network overview data from a single query.
+    data_version is the network reporting time; it only keys the cache, so an advancing clock misses immediately.
+    Failures are recorded per view (see collect_async) and raised as PageDataError, so they are never cached.
+    """
+    page_data = collect_async({"network_daily": functools.partial(query_network_daily_resort_data, time_period)})
+    daily_df = page_data.pop("network_daily")
+    if daily_df is None:
+        # Every view comes from the one query, so each of their sections reports its error
+        error = page_data["errors"].pop("network_daily")
+        page_data.update(dict.fromkeys(NETWORK_VIEWS))
+        page_data["errors"].update(dict.fromkeys(NETWORK_VIEWS, error))
+        return raise_if_failed(page_data)
+
+    # One scan of DAILY_RESORT_SUMMARY feeds the KPI, status, comparison and trend views
+    is_current = daily_df["IS_CURRENT"].astype(bool)
+    current_df = daily_df[is_current].drop(columns="IS_CURRENT")
+    load_step(page_data, "kpis", lambda: summarize_network_kpis(current_df, daily_df[~is_current]))
+    load_step(page_data, "comparison", lambda: summarize_network_resort_comparison(current_df))
+    load_step(page_data, "status",
+              lambda: summarize_network_status_by_resort(page_section(page_data, "comparison")))
+    load_step(page_data, "time_series", lambda: summarize_network_time_series_data(current_df))
+    return raise_if_failed(page_data)
+
+
+def get_network_page_data(time_period: str, data_version: Optional[datetime]) -> dict[str, Any]:
+    """Network overview data; on a partial failure, the uncached data with each failed view's error."""
+    try:
+        return fetch_network_page_data(time_period, data_version)
+    except PageDataError as e:
+        return e.page_data
 
 
-@st.cache_data(ttl=DEFAULT_CACHE_TTL)
-def get_resort_capacity_data() -> pd.DataFrame:
+def fetch_resort_capacity_data() -> pd.DataFrame:
     """
     Fetch and cache the complete RESORT_CAPACITY table.
     Since it's a small reference table, we cache the whole thing.
@@ -271,124 +468,314 @@ def get_resort_capacity_data() -> pd.DataFrame:
                   .select("RESORT", "MAX_CAPACITY", "HOURLY_CAPACITY",
                           "BASE_LIFT_COUNT", "IANA_TIMEZONE")
                   .order_by("RESORT"))
-    return results_df.to_pandas()
+    return results_df.to_pandas(statement_params=query_tag("resort_capacity"))
 
 
-def get_available_resorts() -> pd.DataFrame:
+@st.cache_resource
+def resort_capacity_cache() -> SharedCache:
+    return SharedCache(fetch_resort_capacity_data, ttl=REFERENCE_CACHE_TTL)
+
+
+def get_resort_capacity_data() -> pd.DataFrame:
+    return resort_capacity_cache().get()
+
+
+def get_available_resorts() -> tuple[str, ...]:
     """
-    Get list of available resorts from RESORT_CAPACITY table.
-    Returns a DataFrame with resort names only for compatibility.
+    Get the names of available resorts from the RESORT_CAPACITY table.
+    The capacity frame is already held by a shared reference cache, so this is one pass over a short column.
     """
-    capacity_df = get_resort_capacity_data()
-    return capacity_df[["RESORT"]].copy()
+    return tuple(get_resort_capacity_data()["RESORT"])
+
+
+def fetch_resort_capacity_maps() -> dict[str, dict]:
+    """Index each RESORT_CAPACITY column by resort, so per-resort lookups are dict hits instead of pandas scans."""
+    capacity_df = get_resort_capacity_data().set_index("RESORT")
+    return {column: capacity_df[column].to_dict() for column in capacity_df.columns}
+
+
+@st.cache_resource
+def resort_capacity_maps_cache() -> SharedCache:
+    return SharedCache(fetch_resort_capacity_maps, ttl=REFERENCE_CACHE_TTL)
 
 
 def get_iana_timezone(resort: str) -> Optional[str]:
-    capacity_df = get_resort_capacity_data()
-    resort_row = capacity_df[capacity_df["RESORT"] == resort]
-    if resort_row.empty:
-        return None
-    return resort_row.iloc[0]["IANA_TIMEZONE"]
+    return resort_capacity_maps_cache().get()["IANA_TIMEZONE"].get(resort)
 
 
-def convert_to_local_time(resort: str, utc_datetime: datetime) -> Optional[datetime]:
+def convert_to_local_time(resort: str, utc_datetime: Optional[datetime]) -> Optional[datetime]:
     timezone_str = get_iana_timezone(resort)
-    if timezone_str is None:
+    if timezone_str is None or utc_datetime is None:
         return None
     try:
-        # Ensure the input datetime is timezone-aware (UTC)
+        # Naive timestamps from Snowflake are UTC; aware ones convert directly
         if utc_datetime.tzinfo is None:
-            utc_datetime = pytz.UTC.localize(utc_datetime)
-        elif utc_datetime.tzinfo != pytz.UTC:
-            # Convert to UTC if it's in a different timezone
-            utc_datetime = utc_datetime.astimezone(pytz.UTC)
-        # Convert to local timezone
-        local_tz = pytz.timezone(timezone_str)
-        local_datetime = utc_datetime.astimezone(local_tz)
-        return local_datetime
+            utc_datetime = utc_datetime.replace(tzinfo=pytz.UTC)
+        return utc_datetime.astimezone(pytz.timezone(timezone_str))
     except Exception as e:
         st.error(f"Error converting time for resort {resort}: {e}")
         return None
 
 
-@st.cache_data(ttl=DEFAULT_CACHE_TTL)
-def get_available_resorts() -> pd.DataFrame:
-    """Fetch list of available resorts."""
-    results_df = (session.table("DAILY_RESORT_SUMMARY")
-                  .select("RESORT")
-                  .distinct()
-                  .order_by("RESORT"))
-    return results_df.to_pandas()
-
-@st.cache_data(ttl=DEFAULT_CACHE_TTL)
-def get_resort_operations_data(selected_resort: str) -> pd.DataFrame:
-    """Fetch latest operational metrics for a specific resort from most recent hourly data."""
-    reporting_date = get_resort_reporting_date(selected_resort)
-    reporting_hour = get_resort_reporting_hour(selected_resort)
+def query_resort_operations_data(selected_resort: str, reporting_time: datetime) -> DataFrame:
+    """Build latest operational metrics query for a specific resort from most recent hourly data."""
     results_df = (session.table("HOURLY_RESORT_SUMMARY")
                   .filter((col("RESORT") == selected_resort) &
-                          (col("RIDE_DATE") == reporting_date) &
-                          (col("RIDE_HOUR") == reporting_hour))
+                          (col("RIDE_DATE") == reporting_time.date()) &
+                          (col("RIDE_HOUR") == reporting_time.hour))
                   .select(col("VISITOR_COUNT").alias("CURRENT_VISITORS"),
                           col("CAPACITY_PCT").alias("CURRENT_CAPACITY_PCT"),
                           col("TOTAL_RIDES").alias("CURRENT_HOUR_RIDES"),
                           col("TOTAL_RECOGNIZED_REVENUE").alias("CURRENT_HOUR_REVENUE"),
                           col("CAPACITY_STATUS")))
-    return results_df.to_pandas()
+    return results_df
 
 
-@st.cache_data(ttl=DEFAULT_CACHE_TTL)
-def get_resort_top_lifts(selected_resort: str) -> pd.DataFrame:
-    """Fetch top performing lifts for a resort from last 30 minutes."""
-    # Invoke tabular procedure to get top 10 lifts for selected resort
+def query_resort_top_lifts(selected_resort: str) -> DataFrame:
+    """Build top performing lifts query for a resort from last 30 minutes."""
+    # Invoke tabular procedure to get lift stats for selected resort. Call it with the resort only, so
+    # accounts still running the one-argument procedure keep working. The current procedure already
+    # stops at its default top_n of 10; the older one returns every lift, so the top 10 are filtered here too.
     results_df = session.call('get_resort_lift_performance', lit(selected_resort))
-    results_df = results_df.filter(col("USAGE_RANK_IN_RESORT") <= 10).order_by(col("USAGE_RANK_IN_RESORT"))
-    return results_df.to_pandas()
+    # Relative activity against the busiest returned lift, computed alongside the results
+    results_df = (results_df
+                  .filter(col("USAGE_RANK_IN_RESORT") <= 10)
+                  .with_column("PROGRESS", div0(col("RIDES"), max(col("RIDES")).over()))
+                  .order_by(col("USAGE_RANK_IN_RESORT")))
+    return results_df
 
 
-@st.cache_data(ttl=DEFAULT_CACHE_TTL)
-def get_resort_hourly_patterns(selected_resort: str) -> pd.DataFrame:
-    """Fetch hourly visitor patterns for a resort from most recent date."""
-    reporting_date = get_resort_reporting_date(selected_resort)
-    target_timezone = get_iana_timezone(selected_resort)
+def query_resort_hourly_patterns(selected_resort: str, reporting_time: datetime) -> DataFrame:
+    """Build hourly visitor patterns query for a resort from most recent date."""
     results_df = (session.table("HOURLY_RESORT_SUMMARY")
-                  .filter((col("RESORT") == selected_resort) & (col("RIDE_DATE") == reporting_date))
-                  .with_column("LOCAL_TIMESTAMP", convert_timezone(lit(target_timezone), col("RIDE_HOUR_TIMESTAMP"), lit('UTC')))
-                  .select(hour(col("LOCAL_TIMESTAMP")).alias("RIDE_HOUR"),
-                          col("LOCAL_TIMESTAMP").cast("DATE").alias("RIDE_DATE"),
-                          "RIDE_HOUR_TIMESTAMP",
+                  .filter((col("RESORT") == selected_resort) & (col("RIDE_DATE") == reporting_time.date()))
+                  .select("RIDE_HOUR_TIMESTAMP",
                           "VISITOR_COUNT",
                           "CAPACITY_PCT",
-                          "TOTAL_RECOGNIZED_REVENUE").order_by("RIDE_HOUR"))
-    return results_df.to_pandas()
+                          "TOTAL_RECOGNIZED_REVENUE"))
+    return results_df
+
 
+def localize_hourly_patterns(hourly_df: pd.DataFrame, selected_resort: str) -> pd.DataFrame:
+    """Add resort-local hour and date to hourly patterns; at most 24 rows, so this is cheap in pandas."""
+    target_timezone = get_iana_timezone(selected_resort) or "UTC"
+    local_timestamps = (pd.to_datetime(hourly_df["RIDE_HOUR_TIMESTAMP"])
+                        .dt.tz_localize("UTC")
+                        .dt.tz_convert(target_timezone))
+    hourly_df.insert(0, "RIDE_HOUR", local_timestamps.dt.hour)
+    hourly_df.insert(1, "RIDE_DATE", local_timestamps.dt.date)
+    return hourly_df.sort_values("RIDE_HOUR", ignore_index=True)
 
-@st.cache_data(ttl=DEFAULT_CACHE_TTL)
-def get_resort_revenue_performance(selected_resort: str) -> pd.DataFrame:
-    """Fetch revenue performance metrics for a resort from most recent date."""
-    reporting_date = get_resort_reporting_date(selected_resort)
+
+def query_resort_revenue_performance(selected_resort: str, reporting_time: datetime) -> DataFrame:
+    """Build revenue performance query for a resort from most recent date."""
     results_df = (session.table("V_DAILY_REVENUE_PERFORMANCE")
-                  .filter((col("RESORT") == selected_resort) & (col("RIDE_DATE") == reporting_date))
+                  .filter((col("RESORT") == selected_resort) & (col("RIDE_DATE") == reporting_time.date()))
                   .select("TOTAL_REVENUE", "REVENUE_TARGET_USD", "REVENUE_TARGET_PCT", "PERFORMANCE_STATUS"))
-    return results_df.to_pandas()
+    return results_df
 
 
-@st.cache_data(ttl=DEFAULT_CACHE_TTL)
-def get_resort_weekly_performance(selected_resort: str) -> pd.DataFrame:
-    """Fetch weekly performance summary for a resort."""
+@st.cache_data(ttl=WEEKLY_CACHE_TTL)
+def get_all_resorts_weekly_performance() -> pd.DataFrame:
+    """
+    Fetch the latest four weeks of performance for every resort in one query.
+    Weekly data does not depend on a resort's reporting time, so switching resorts slices this frame locally.
+    """
+    latest_weeks = Window.partition_by("RESORT").order_by(desc("WEEK_START_DATE"))
     results_df = (session.table("WEEKLY_RESORT_SUMMARY")
-                  .filter(col("RESORT") == selected_resort)
-                  .select("WEEK_START_DATE", "MAX_DAILY_UNIQUE_VISITORS", "AVG_DAILY_UNIQUE_VISITORS",
-                          "WEEK_TOTAL_REVENUE", "AVG_DAILY_REVENUE", "WEEK_PEAK_CAPACITY_PCT")
-                  .order_by(desc("WEEK_START_DATE"))
-                  .limit(4))
-    return results_df.to_pandas()
+                  .select("RESORT", "WEEK_START_DATE", "MAX_DAILY_UNIQUE_VISITORS", "AVG_DAILY_UNIQUE_VISITORS",
+                          "WEEK_TOTAL_REVENUE", "AVG_DAILY_REVENUE", "WEEK_PEAK_CAPACITY_PCT",
+                          row_number().over(latest_weeks).alias("WEEK_RANK"))
+                  .filter(col("WEEK_RANK") <= 4)
+                  .order_by("RESORT", desc("WEEK_START_DATE")))
+    weekly_df = results_df.to_pandas(statement_params=query_tag("weekly"))
+    # Each resort name repeats per week; as a category the per-resort slice compares codes, not strings
+    return weekly_df.astype({"RESORT": "category"})
+
+
+def get_resort_weekly_performance(selected_resort: str) -> pd.DataFrame:
+    """Slice one resort's weeks, projected and renamed for the weekly table so reruns render it as-is."""
+    all_weekly_df = get_all_resorts_weekly_performance()
+    return (all_weekly_df.loc[all_weekly_df["RESORT"] == selected_resort, list(WEEKLY_COLUMN_MAP)]
+            .rename(columns=WEEKLY_COLUMN_MAP)
+            .reset_index(drop=True))
+
+
+@st.cache_data(ttl=DEFAULT_CACHE_TTL, max_entries=CACHE_MAX_ENTRIES)
+def fetch_resort_page_data(selected_resort: str, reporting_time: Optional[datetime]) -> dict[str, Any]:
+    """
+    Fetch all operations center data for a resort with every query in flight at once.
+    The resort reporting time is part of the cache key, so every query filters on the hour it was cached for.
+    Failures are recorded per section (see collect_async) and raised as PageDataError, so they are never cached.
+    """
+    queries = {"top_lifts": functools.partial(query_resort_top_lifts, selected_resort)}
+    if reporting_time is not None:
+        queries.update({
+            "operations": functools.partial(query_resort_operations_data, selected_resort, reporting_time),
+            "hourly": functools.partial(query_resort_hourly_patterns, selected_resort, reporting_time),
+            "revenue": functools.partial(query_resort_revenue_performance, selected_resort, reporting_time),
+        })
+    page_data = collect_async(queries)
+    if reporting_time is None:
+        # No activity yet: the reporting-hour sections have nothing to show and render their "no data" messages
+        page_data.update({"operations": pd.DataFrame(), "hourly": pd.DataFrame(), "revenue": pd.DataFrame()})
+    else:
+        load_step(page_data, "hourly",
+                  lambda: localize_hourly_patterns(page_section(page_data, "hourly"), selected_resort))
+    load_step(page_data, "weekly", lambda: get_resort_weekly_performance(selected_resort))
+    return raise_if_failed(page_data)
+
+
+def get_resort_page_data(selected_resort: str, reporting_time: Optional[datetime]) -> dict[str, Any]:
+    """Operations center data for a resort; on a partial failure, the uncached data with each failed section's error."""
+    try:
+        return fetch_resort_page_data(selected_resort, reporting_time)
+    except PageDataError as e:
+        return e.page_data
+
+
+# Comparison charts are cached per (period, metric), like the trend charts below
+@st.cache_data(ttl=DEFAULT_CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def build_network_comparison_chart(time_period: str, comparison_metric: str,
+                                   data_version: Optional[datetime]) -> Optional["go.Figure"]:
+    """Build the resort comparison bar chart for a period and metric."""
+    resort_data = page_section(get_network_page_data(time_period, data_version), "comparison")
+    if resort_data.empty:
+        return None
+
+    metric_mapping = {
+        "Visitors": "TOTAL_VISITORS",
+        "Revenue": "TOTAL_REVENUE",
+        "Capacity %": "AVG_CAPACITY",
+        "Lift Rides": "TOTAL_RIDES"
+    }
+    metric_column = metric_mapping[comparison_metric]
+    if metric_column not in resort_data.columns:
+        return None
+
+    import plotly.graph_objects as go
+
+    values = resort_data[metric_column]
+    fig = go.Figure(
+        data=[
+            go.Bar(
+                x=resort_data["RESORT"],
+                y=values,
+                marker=dict(color=values, colorscale="Blues", showscale=True,
+                            colorbar=dict(title=metric_column))
+            )
+        ],
+        layout=dict(
+            CHART_LAYOUT,
+            title=f"{comparison_metric} by Resort",
+            xaxis=dict(title="RESORT"),
+            yaxis=dict(title=metric_column)
+        )
+    )
+    return fig
+
+
+# Trend charts are cached per (period, metric), so switching metrics reuses the cached series and figure
+@st.cache_data(ttl=DEFAULT_CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def build_network_trend_chart(time_period: str, trend_metric: str,
+                              data_version: Optional[datetime]) -> Optional["go.Figure"]:
+    """Build the trends-by-resort line chart for a period and metric."""
+    time_series_data = page_section(get_network_page_data(time_period, data_version), "time_series")
+    if time_series_data.empty or 'RIDE_DATE' not in time_series_data.columns:
+        return None
+
+    trend_mapping = {
+        "Visitors": "VISITORS",
+        "Revenue": "REVENUE",
+        "Capacity %": "CAPACITY_PCT"
+    }
+    trend_column = trend_mapping[trend_metric]
+    if trend_column not in time_series_data.columns:
+        return None
+
+    import plotly.graph_objects as go
+
+    # RIDE_DATE arrives as dates; declaring the axis type lets plotly use them without parsing
+    xaxis = dict(title="RIDE_DATE", type="date")
+    if time_period != "Today":
+        # For other periods, label one tick per day; plotly formats the date axis client-side
+        xaxis.update(tickformat='%Y-%m-%d', dtick="D1")
+
+    # One trace per resort, in first-seen order like plotly express' color grouping
+    fig = go.Figure(
+        data=[
+            go.Scatter(
+                x=rows['RIDE_DATE'],
+                y=rows[trend_column],
+                name=resort,
+                mode='lines+markers'
+            )
+            for resort, rows in time_series_data.groupby("RESORT", sort=False)
+        ],
+        layout=dict(
+            CHART_LAYOUT,
+            title=f"{trend_metric} Trends by Resort",
+            xaxis=xaxis,
+            yaxis=dict(title=trend_column),
+            legend=dict(title=dict(text="RESORT"))
+        )
+    )
+    return fig
+
+
+# Hourly chart is cached per resort, so reruns that don't change the data reuse the built figure
+@st.cache_data(ttl=DEFAULT_CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def build_resort_hourly_chart(selected_resort: str, reporting_time: Optional[datetime]) -> Optional["go.Figure"]:
+    """Build the visitors-through-the-day chart for a resort."""
+    hourly_data = page_section(get_resort_page_data(selected_resort, reporting_time), "hourly")
+    if hourly_data.empty or 'RIDE_HOUR' not in hourly_data.columns or 'VISITOR_COUNT' not in hourly_data.columns:
+        return None
+
+    import plotly.graph_objects as go
+
+    # Build data and layout in the constructor so plotly validates the figure once
+    fig = go.Figure(
+        # Single line showing visitor count throughout the day
+        data=[
+            go.Scatter(
+                x=hourly_data['RIDE_HOUR'],
+                y=hourly_data['VISITOR_COUNT'],
+                name='Visitors on Mountain',
+                mode='lines+markers',
+                line=dict(color='#2E86AB', width=3),
+                fill='tozeroy',
+                fillcolor='rgba(46, 134, 171, 0.1)'
+            )
+        ],
+        layout=dict(
+            title="Visitors on Mountain Throughout the Day",
+            showlegend=False,
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            font=dict(family="Arial"),
+            xaxis=dict(
+                title="Hour of Day",
+                range=[6, 22],  # Show full ski day (6 AM to 10 PM)
+                dtick=2  # Show every 2 hours
+            ),
+            yaxis=dict(
+                title="Number of Visitors",
+                rangemode='tozero'  # Start from 0
+            )
+        )
+    )
+
+    return fig
 
 
 # Handle page refresh action
 def handle_refresh(page_name):
     """Handle refresh with user feedback."""
     st.cache_data.clear()
+    network_reporting_time_cache().clear()
+    resort_capacity_cache().clear()
+    resort_capacity_maps_cache().clear()
+    resort_reporting_time_cache.clear()
     st.rerun()
 
 
@@ -426,18 +813,6 @@ def get_capacity_icon(capacity: float) -> str:
         return "🔴"
 
 
-# Chart styling
-def style_chart(fig):
-    """Apply consistent styling to charts."""
-    fig.update_layout(
-        font_family="Arial",
-        title_font_size=16,
-        plot_bgcolor='white',
-        paper_bgcolor='white'
-    )
-    return fig
-
-
 # Initialize session state
 # Default to the network overview page
 if 'current_page' not in st.session_state:
@@ -479,16 +854,26 @@ if st.session_state.current_page == NETWORK_PAGE_NAME:
                                    ["Today", "Last 7 Days", "Month to Date"])
         st.markdown("---")
 
+    # Every network cache below is keyed on this clock reading. If it can't be read, the status banner
+    # already shows why, and the query below hits the same error and reports it in each section.
+    try:
+        data_version = get_network_reporting_time()
+    except Exception:
+        data_version = None
+
+    # Fetch every dataset for the page concurrently; each section reports its own failure
+    network_data = get_network_page_data(time_period, data_version)
+
     # Network Performance Metrics
     st.header("📊 Network Performance")
     st.caption(f"Data for: {time_period}")
 
     try:
-        current_data, previous_data = get_network_kpis(time_period)
+        kpi_data = page_section(network_data, "kpis")
 
-        if not current_data.empty and not previous_data.empty:
-            current = current_data.iloc[0]
-            previous = previous_data.iloc[0]
+        if not kpi_data.empty:
+            # Current and previous period metrics share the single KPI row
+            current = previous = kpi_data.iloc[0]
 
             # Calculate changes
             visitor_change = calculate_percentage_change(
@@ -535,21 +920,18 @@ if st.session_state.current_page == NETWORK_PAGE_NAME:
     # Resort Status Overview
     st.header("🏔️ Resort Status Summary")
     try:
-        status_data = get_network_status_by_resort(time_period)
+        status_data = page_section(network_data, "status")
 
         if not status_data.empty:
-            # Format data for display
-            display_data = status_data.copy()
-            display_data['CURRENT_VISITORS'] = display_data['CURRENT_VISITORS'].apply(format_number)
-            display_data['CAPACITY_PCT'] = display_data['CAPACITY_PCT'].apply(
-                lambda x: f"{x:.1f}%" if not pd.isna(x) else "0%")
-            display_data['REVENUE'] = display_data['REVENUE'].apply(format_currency)
-
-            # Select and rename columns
-            display_data = display_data[['RESORT', 'CURRENT_VISITORS', 'CAPACITY_PCT', 'REVENUE', 'STATUS']]
+            # Select and rename columns; numbers keep their dtype and are formatted by the frontend
+            display_data = status_data[['RESORT', 'CURRENT_VISITORS', 'CAPACITY_PCT', 'REVENUE', 'STATUS']]
             display_data.columns = ['Resort', 'Visitors', 'Capacity', 'Revenue', 'Status']
 
-            st.dataframe(display_data, use_container_width=True, hide_index=True)
+            st.dataframe(display_data, use_container_width=True, hide_index=True, column_config={
+                'Visitors': st.column_config.NumberColumn(format="localized"),
+                'Capacity': st.column_config.NumberColumn(format="%.1f%%"),
+                'Revenue': st.column_config.NumberColumn(format="dollar"),
+            })
         else:
             st.info("No resort status data available for the selected time period.")
     except Exception as e:
@@ -566,29 +948,10 @@ if st.session_state.current_page == NETWORK_PAGE_NAME:
 
     with col2:
         try:
-            resort_data = get_network_resort_comparison(time_period)
-
-            if not resort_data.empty:
-                metric_mapping = {
-                    "Visitors": "TOTAL_VISITORS",
-                    "Revenue": "TOTAL_REVENUE",
-                    "Capacity %": "AVG_CAPACITY",
-                    "Lift Rides": "TOTAL_RIDES"
-                }
-                metric_column = metric_mapping[comparison_metric]
-
-                if metric_column in resort_data.columns:
-                    fig = px.bar(
-                        resort_data,
-                        x="RESORT",
-                        y=metric_column,
-                        title=f"{comparison_metric} by Resort",
-                        color=metric_column,
-                        color_continuous_scale="Blues"
-                    )
-                    fig = style_chart(fig)
-                    st.plotly_chart(fig, use_container_width=True)
-            else:
+            fig = build_network_comparison_chart(time_period, comparison_metric, data_version)
+            if fig is not None:
+                st.plotly_chart(fig, use_container_width=True)
+            elif network_data["comparison"].empty:
                 st.info("No resort comparison data available for the selected time period.")
         except Exception as e:
             st.error(f"Error fetching resort comparison data: {str(e)}")
@@ -607,40 +970,10 @@ if st.session_state.current_page == NETWORK_PAGE_NAME:
                                     ["Visitors", "Revenue", "Capacity %"])
     with col2:
         try:
-            time_series_data = get_network_time_series_data(time_period)
-
-            if not time_series_data.empty and 'RIDE_DATE' in time_series_data.columns:
-                trend_mapping = {
-                    "Visitors": "VISITORS",
-                    "Revenue": "REVENUE",
-                    "Capacity %": "CAPACITY_PCT"
-                }
-                trend_column = trend_mapping[trend_metric]
-
-                if trend_column in time_series_data.columns:
-                    # Fix time axis formatting based on time period
-                    time_series_copy = time_series_data.copy()
-
-                    # Format dates properly based on time period
-                    if time_period == "Today":
-                        # For today, ensure we have proper time formatting
-                        time_series_copy['RIDE_DATE'] = pd.to_datetime(time_series_copy['RIDE_DATE'])
-                    else:
-                        # For other periods, use date formatting
-                        time_series_copy['RIDE_DATE'] = pd.to_datetime(time_series_copy['RIDE_DATE']).dt.strftime(
-                            '%Y-%m-%d')
-
-                    fig = px.line(
-                        time_series_copy,
-                        x="RIDE_DATE",
-                        y=trend_column,
-                        color="RESORT",
-                        title=f"{trend_metric} Trends by Resort",
-                        markers=True
-                    )
-                    fig = style_chart(fig)
-                    st.plotly_chart(fig, use_container_width=True)
-            else:
+            fig = build_network_trend_chart(time_period, trend_metric, data_version)
+            if fig is not None:
+                st.plotly_chart(fig, use_container_width=True)
+            elif network_data["time_series"].empty or 'RIDE_DATE' not in network_data["time_series"].columns:
                 st.info("No time series data available for the selected time period.")
         except Exception as e:
             st.error(f"Error fetching time series data: {str(e)}")
@@ -648,26 +981,25 @@ if st.session_state.current_page == NETWORK_PAGE_NAME:
 elif st.session_state.current_page == RESORT_PAGE_NAME:
 
     # Get available resorts
-    resorts_df = None
+    resort_list = ()
     try:
-        resorts_df = get_available_resorts()
+        resort_list = get_available_resorts()
     except Exception as e:
         st.error(f"Error loading resort list: {str(e)}")
-    if resorts_df is None or resorts_df.empty:
+    if not resort_list:
         st.error("No resort data is available.")
         st.stop()  # Prevent the rest of the page from rendering
 
     # Initialize selected_resort in session state if not exists
     # This ensures that the selected resort persists across reruns and page changes
     if 'selected_resort' not in st.session_state:
-        st.session_state.selected_resort = resorts_df['RESORT'].tolist()[0]  # Default to first resort
+        st.session_state.selected_resort = resort_list[0]  # Default to first resort
 
     # Page-specific sidebar with time period selector
     with st.sidebar:
         st.markdown("---")
 
         # Get the current index of the selected resort for the selectbox
-        resort_list = resorts_df['RESORT'].tolist()
         try:
             current_index = resort_list.index(st.session_state.selected_resort)
         except ValueError:
@@ -707,12 +1039,22 @@ elif st.session_state.current_page == RESORT_PAGE_NAME:
     display_simulation_status(resort=selected_resort)
     st.markdown("---")
 
+    # Resolve the resort clock once so every dataset and chart on the page uses the same hour. If it can't be
+    # read, the status banner already shows why, and each section reports its own error.
+    try:
+        reporting_time = get_resort_reporting_time(selected_resort)
+    except Exception:
+        reporting_time = None
+
+    # Fetch every dataset for the page concurrently; each section reports its own failure
+    resort_page_data = get_resort_page_data(selected_resort, reporting_time)
+
     # Real-time Operations Metrics
     st.header("⚡ Mountain Operations Summary")
     st.caption("Aggregated data based on current reporting hour (may be incomplete)")
 
     try:
-        operations_data = get_resort_operations_data(selected_resort)
+        operations_data = page_section(resort_page_data, "operations")
 
         if not operations_data.empty:
             ops = operations_data.iloc[0]
@@ -725,7 +1067,7 @@ elif st.session_state.current_page == RESORT_PAGE_NAME:
             with col2:
                 capacity = ops.get('CURRENT_CAPACITY_PCT', 0)
                 status = ops.get('CAPACITY_STATUS', 'NORMAL')
-                icon = {"HIGH": "🔴", "MODERATE": "🟡", "NORMAL": "🟢"}.get(status, "🟢")
+                icon = CAPACITY_STATUS_ICONS.get(status, "🟢")
                 st.metric("Live Capacity", f"{capacity:.1f}% {icon}")
 
             with col3:
@@ -743,55 +1085,34 @@ elif st.session_state.current_page == RESORT_PAGE_NAME:
     st.caption("Live performance based on last 30 minutes of streaming data")
 
     try:
-        realtime_lifts = get_resort_top_lifts(selected_resort)
+        realtime_lifts = page_section(resort_page_data, "top_lifts")
         if not realtime_lifts.empty:
-            # Get max rides for scaling the bars
-            max_rides = realtime_lifts['RIDES'].max()
-
-            for idx, lift in realtime_lifts.iterrows():
-                # Create container for each lift
-                with st.container():
-                    col1, col2, col3, col4 = st.columns([4, 1.5, 1.5, 1])
-
-                    with col1:
-                        # Lift name with rank or rank emoji (for top 3!)
-                        rank_map = {1: "🥇", 2: "🥈", 3: "🥉"}
-                        rank = rank_map.get(int(lift['USAGE_RANK_IN_RESORT']), lift['USAGE_RANK_IN_RESORT'])
-                        st.write(f"**{rank}. {lift['LIFT']}**")
-
-                        # Progress bar showing relative activity
-                        progress_value = lift['RIDES'] / max_rides if max_rides > 0 else 0
-                        st.progress(progress_value)
-
-                    with col2:
-                        st.metric(
-                            "Rides (30min)",
-                            f"{int(lift['RIDES'])}",
-                            help="Total rides in last 30 minutes"
-                        )
-
-                    with col3:
-                        st.metric(
-                            "Visitors",
-                            f"{int(lift['UNIQUE_VISITORS'])}",
-                            help="Unique visitors in last 30 minutes"
-                        )
-
-                    with col4:
-                        # Activity indicator
-                        rides_per_hour = lift['RIDES_PER_HOUR']
-                        if rides_per_hour > 200:
-                            activity_indicator = "🔥"
-                            activity_text = "Hot"
-                        elif rides_per_hour > 100:
-                            activity_indicator = "⚡"
-                            activity_text = "Active"
-                        else:
-                            activity_indicator = "🟢"
-                            activity_text = "Normal"
-
-                        st.write(f"{activity_indicator}")
-                        st.caption(f"{activity_text}")
+            # Derive display values for all lifts up front
+            activity_text = (pd.cut(realtime_lifts['RIDES_PER_HOUR'], ACTIVITY_BINS, labels=ACTIVITY_LABELS)
+                             .astype(object)
+                             .fillna("Normal"))
+            display_lifts = pd.DataFrame({
+                'Lift': realtime_lifts['USAGE_RANK_IN_RESORT'].map(RANK_EMOJI).fillna(
+                    realtime_lifts['USAGE_RANK_IN_RESORT'].astype(str)) + ". " + realtime_lifts['LIFT'],
+                'Relative Activity': realtime_lifts['PROGRESS'],
+                'Rides (30min)': realtime_lifts['RIDES'],
+                'Visitors': realtime_lifts['UNIQUE_VISITORS'],
+                'Activity': activity_text.map(ACTIVITY_ICONS) + " " + activity_text,
+            })
+
+            # One table element for all lifts instead of a container and columns per lift
+            st.dataframe(
+                display_lifts,
+                use_container_width=True,
+                hide_index=True,
+                column_config={
+                    'Relative Activity': st.column_config.ProgressColumn(min_value=0, max_value=1),
+                    'Rides (30min)': st.column_config.NumberColumn(help="Total rides in last 30 minutes",
+                                                                   format="localized"),
+                    'Visitors': st.column_config.NumberColumn(help="Unique visitors in last 30 minutes",
+                                                              format="localized"),
+                }
+            )
 
         else:
             st.info("No recent lift activity data available.")
@@ -803,45 +1124,10 @@ elif st.session_state.current_page == RESORT_PAGE_NAME:
     st.header("📈 Hourly Activity Patterns")
 
     try:
-        hourly_data = get_resort_hourly_patterns(selected_resort)
-
-        if not hourly_data.empty and 'RIDE_HOUR' in hourly_data.columns and 'VISITOR_COUNT' in hourly_data.columns:
-
-            fig = go.Figure()
-
-            # Single line showing visitor count throughout the day
-            fig.add_trace(
-                go.Scatter(
-                    x=hourly_data['RIDE_HOUR'],
-                    y=hourly_data['VISITOR_COUNT'],
-                    name='Visitors on Mountain',
-                    mode='lines+markers',
-                    line=dict(color='#2E86AB', width=3),
-                    fill='tozeroy',
-                    fillcolor='rgba(46, 134, 171, 0.1)'
-                )
-            )
-
-            fig.update_layout(
-                title="Visitors on Mountain Throughout the Day",
-                xaxis_title="Hour of Day",
-                yaxis_title="Number of Visitors",
-                showlegend=False,
-                plot_bgcolor='white',
-                paper_bgcolor='white',
-                font_family="Arial",
-                xaxis=dict(
-                    range=[6, 22],  # Show full ski day (6 AM to 10 PM)
-                    dtick=2  # Show every 2 hours
-                ),
-                yaxis=dict(
-                    rangemode='tozero'  # Start from 0
-                )
-            )
-
-            st.plotly_chart(fig, use_container_width=True)
-
+        hourly_fig = build_resort_hourly_chart(selected_resort, reporting_time)
 
+        if hourly_fig is not None:
+            st.plotly_chart(hourly_fig, use_container_width=True)
         else:
             st.info("No hourly pattern data available for this resort.")
     except Exception as e:
@@ -854,26 +1140,28 @@ elif st.session_state.current_page == RESORT_PAGE_NAME:
         st.header("💰 Daily Performance")
 
         try:
-            revenue_data = get_resort_revenue_performance(selected_resort)
+            revenue_data = page_section(resort_page_data, "revenue")
 
             if not revenue_data.empty:
-                rev = revenue_data.iloc[0]
+                rev = revenue_data.iloc[0].to_dict()
+
+                # Prepare all metric values, then render
+                total_revenue = format_currency(rev.get('TOTAL_REVENUE', 0))
+                revenue_target = format_currency(rev.get('REVENUE_TARGET_USD', 0))
+                # Status - fixed to handle potential None/undefined values
+                icon = REVENUE_STATUS_ICONS.get(rev.get('PERFORMANCE_STATUS', 'UNKNOWN'), '⚪')
+                target_pct = rev.get('REVENUE_TARGET_PCT', 0) or 0  # Handle None values
 
                 # Horizontal layout with three columns
                 col_a, col_b, col_c = st.columns(3)
 
                 with col_a:
-                    st.metric("Today's Revenue", format_currency(rev.get('TOTAL_REVENUE', 0)))
+                    st.metric("Today's Revenue", total_revenue)
 
                 with col_b:
-                    st.metric("Revenue Target", format_currency(rev.get('REVENUE_TARGET_USD', 0)))
+                    st.metric("Revenue Target", revenue_target)
 
                 with col_c:
-                    # Status - fixed to handle potential None/undefined values
-                    status_icons = {'ABOVE_TARGET': '🟢', 'NEAR_TARGET': '🟡', 'BELOW_TARGET': '🔴'}
-                    status = rev.get('PERFORMANCE_STATUS', 'UNKNOWN')
-                    icon = status_icons.get(status, '⚪')
-                    target_pct = rev.get('REVENUE_TARGET_PCT', 0) or 0  # Handle None values
                     st.metric("Target Achievement", f"{target_pct:.1f}% {icon}")
             else:
                 st.info("No revenue performance data available for this resort.")
@@ -884,41 +1172,18 @@ elif st.session_state.current_page == RESORT_PAGE_NAME:
         st.header("📅 Weekly Performance")
 
         try:
-            weekly_data = get_resort_weekly_performance(selected_resort)
+            weekly_data = page_section(resort_page_data, "weekly")
 
             if not weekly_data.empty:
-                # Format weekly data
-                display_data = weekly_data.copy()
-
-                # Format columns that exist
-                format_funcs = {
-                    'WEEK_START_DATE': lambda x: pd.to_datetime(x).strftime('%Y-%m-%d'),
-                    'MAX_DAILY_UNIQUE_VISITORS': format_number,
-                    'AVG_DAILY_UNIQUE_VISITORS': format_number,
-                    'WEEK_TOTAL_REVENUE': format_currency,
-                    'AVG_DAILY_REVENUE': format_currency,
-                    'WEEK_PEAK_CAPACITY_PCT': lambda x: f"{x:.1f}%"
-                }
-
-                for col_name, func in format_funcs.items():
-                    if col_name in display_data.columns:
-                        display_data[col_name] = display_data[col_name].apply(func)
-
-                # Select and rename columns
-                column_map = {
-                    'WEEK_START_DATE': 'Week Starting',
-                    'WEEK_PEAK_VISITORS': 'Max Daily Visitors',
-                    'AVG_DAILY_VISITORS': 'Avg Daily Visitors',
-                    'WEEK_TOTAL_REVENUE': 'Total Revenue',
-                    'AVG_DAILY_REVENUE': 'Avg Daily Revenue',
-                    'WEEK_PEAK_CAPACITY_PCT': 'Peak Capacity'
-                }
-
-                # Filter existing columns and rename
-                existing_cols = [col for col in column_map.keys() if col in display_data.columns]
-                display_data = display_data[existing_cols].rename(columns=column_map)
-
-                st.dataframe(display_data, use_container_width=True, hide_index=True)
+                # Already projected and renamed in the cached page data; numbers are formatted by the frontend
+                st.dataframe(weekly_data, use_container_width=True, hide_index=True, column_config={
+                    'Week Starting': st.column_config.DateColumn(format="YYYY-MM-DD"),
+                    'Max Daily Visitors': st.column_config.NumberColumn(format="localized"),
+                    'Avg Daily Visitors': st.column_config.NumberColumn(format="localized"),
+                    'Total Revenue': st.column_config.NumberColumn(format="dollar"),
+                    'Avg Daily Revenue': st.column_config.NumberColumn(format="dollar"),
+                    'Peak Capacity': st.column_config.NumberColumn(format="%.1f%%"),
+                })
             else:
                 st.info("No weekly performance data available for this resort.")
         except Exception as e:
@@ -928,6 +1193,5 @@ elif st.session_state.current_page == RESORT_PAGE_NAME:
 else:
     st.error("Invalid page selected. Please choose a valid page from the sidebar.")
 
-# Footer
-st.markdown("---")
-st.markdown("⛷️ Powered by Snowflake", help="Simplified data processing for real-time insights")
+# Footer, emitted as a single element
+st.markdown("---\n\n⛷️ Powered by Snowflake", help="Simplified data processing for real-time insights")
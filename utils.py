@@ -1,14 +1,23 @@
 import logging
 
+# Namespaces for which you want debug level logging
+DEBUG_NAMESPACES = ('snowflake.ingest.streaming',)
+
+_configured = False
+
 
 def configure_logging(level=logging.INFO):
-    # Configure logging at startup
-    logging.basicConfig(level=level, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    # Modules call this at import, so handlers and namespace levels are set up once per
+    # process; a later call still applies the level it asks for
+    global _configured
+    if _configured:
+        logging.getLogger().setLevel(level)
+        return
+    _configured = True
 
-    # List of namespaces for which you want debug level logging
-    debug_namespaces = ['snowflake.ingest.streaming']
+    logging.basicConfig(level=level, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
-    # Setting info level for specific namespaces
-    for namespace in debug_namespaces:
+    # Setting debug level for specific namespaces
+    for namespace in DEBUG_NAMESPACES:
         logger = logging.getLogger(namespace)
         logger.setLevel(logging.DEBUG)